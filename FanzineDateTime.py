@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 from dateutil import parser
 import re
 from contextlib import suppress
-import math
+from functools import lru_cache
 
 from Log import Log, LogError
 from HelpersPackage import ToNumeric, IsNumeric, IsInt, Int
@@ -13,7 +13,30 @@ from HelpersPackage import RemoveHTMLDebris
 from HelpersPackage import CanonicizeColumnHeaders
 
 
+# The free-format dates which end in a 2- or 4-digit year.
+# Each of the more specific patterns is a special case of _RE_TEXT_YEAR, so when it fails to match, none of them can match, either.
+# (_RE_TEXT_YEAR uses DOTALL so that it is never stricter than the patterns it stands guard for.)
+_RE_TEXT_YEAR=re.compile(r"^(?P<text>.+?)[,\s]+(?P<year>\d\d|\d\d\d\d)$", re.DOTALL)     # random text + space + 2- or 4-digit year
+_RE_MONTH_YEAR=re.compile(r"^([\s\w\-',]+).?\s+(\d\d|\d\d\d\d)$")                  # Month +[,] + 2- or 4-digit year
+_RE_MONTH_DAY_YEAR=re.compile(r"^([\s\w\-',]+).?\s+(\d+),?\s+(\d\d|\d\d\d\d)$")   # Month + day +[,] + 2- or 4-digit year
+_RE_DAY_MONTH_YEAR=re.compile(r"^(\d{1,2})\s+([\s\w\-',]+).?\s+(\d\d|\d\d\d\d)$")  # Day + month +[,] + 2- or 4-digit year
+_RE_WORD_DAY_YEAR=re.compile(r"^(\w+)\s+(\d+),?\s+(\d\d|\d\d\d\d)$")               # Month + Day, + 2- or 4-digit year
+_RE_YEAR_ONLY=re.compile(r"^(\d\d\d\d)$")                                            # A 4-digit year all alone
+_RE_WINTER_YEARS=re.compile(r"^Winter[,\s]+\d\d\d\d\s*-\s*(\d\d)$")                  # Winter yyyy-yy
+_RE_MONTH_MONTH_YEAR=re.compile(r"^(\w+)\s*[-/]\s*(\w+)\s,?\s*(\d\d\d\d)$")         # Month-Month yyyy or Month/Month yyyy
+_RE_YEAR_YEAR=re.compile(r"^\d\d\d\d\s*-\s*(\d\d)$")                                  # yyyy-yy
+_RE_COMMA_WS=re.compile(r"[,\s]+")                                                  # A span of commas and whitespace
+_RE_MONTH_RANGE=re.compile(r"^([a-z]+)[-/]([a-z]+)$")                                # month-month or month/month (lower case, no spaces)
+_SEPARATOR_TRANSLATION=str.maketrans("-,", "  ")                                    # Hyphens and commas become spaces
+
+# Used to normalize the separators in a date range
+_DASH_TRANSLATION=str.maketrans({"–": "-", "—": "-"})     # en-dash and em-dash become hyphens
+_RE_DASH_RUN=re.compile(r"\s*-+\s*")                       # A run of hyphens along with any whitespace around it
+
+
 class FanzineDate:
+    __slots__=("_Year", "_Month", "_Day", "_MonthText", "_DayText", "_MonthDayText", "_LongDates")
+
     def __init__(self,
                  Year: int|str|None=None,
                  Month: int|str|tuple[int, str]|None=None,
@@ -28,10 +51,11 @@ class FanzineDate:
         self._Day=None
         self._MonthText=None
         self._DayText=None
-        self._MonthDay=None
+        self._MonthDayText=MonthDayText                 # Overrides display of both month and day, but has no other effect
+        self._LongDates=False
 
         if DateTime is not None:
-            self.DateTime=DateTime
+            self.datetime=DateTime
             return
 
         self._Year=Year
@@ -55,12 +79,9 @@ class FanzineDate:
         elif Day is None and DayText is not None:        # If only DayText is defined, use it to calculate Day
             self.Day=InterpretDay(DayText)
 
-        self._MonthDayText=MonthDayText                 # Overrides display of both month and day, but has no other effect
-        self._LongDates=False
-
 
     def __hash__(self) -> int:
-        return hash(self.Year)+hash(self.Month)+hash(self.MonthText)+hash(self.Day)+hash(self.DayText)+hash(self.MonthDayText)
+        return hash((self._Year, self._Month, self.MonthText, self._Day, self.DayText, self._MonthDayText))
 
 
     # -----------------------------
@@ -99,25 +120,16 @@ class FanzineDate:
     # -----------------------------
     # Define < operator for sorting
     def __lt__(self, other: Self) -> bool:
-        if self._Year is None:
-            return True
-        if other._Year is None:
-            return False
-        if self._Year != other._Year:
-            return self._Year < other._Year
-        if self._Month is None:
-            return True
-        if other._Month is None:
-            return False
-        if self._Month != other._Month:
-            return self._Month < other._Month
-        if self._Day is None:
-            return True
-        if other._Day is None:
-            return False
-        if self._Day != other._Day:
-            return self._Day < other._Day
-        return False
+        return self.SortKey() < other.SortKey()
+
+    # -----------------------------
+    # The tuple that __lt__ compares: Year, then Month, then Day
+    # A missing value is wrapped as (0,) and a present one as (1, value) so that missing values sort first and None is never compared with a number.
+    # Use it directly as a sort key (e.g., sorted(dates, key=FanzineDate.SortKey)) in preference to FormatDateForSorting()
+    def SortKey(self) -> tuple:
+        return ((0,) if self._Year is None else (1, self._Year),
+                (0,) if self._Month is None else (1, self._Month),
+                (0,) if self._Day is None else (1, self._Day))
 
     # -----------------------------
     def Copy(self, other: Self) -> None:
@@ -138,7 +150,7 @@ class FanzineDate:
     #......................
     @property
     def datetime(self):
-        return self.DateTime
+        return self.Date
     @datetime.setter
     def datetime(self, val: datetime):
         #assert type(val) is datetime
@@ -377,29 +389,12 @@ class FanzineDate:
         if len(dateText) == 0:
             return self
 
-        # Turn any long dashes and double hyphens into single hyphens
-        dateText=dateText.replace('—', '-')
-        dateText=dateText.replace('--', '-')
-
-        # There are some dates which follow no useful pattern.  Check for them
-        d=InterpretRandomDatestring(dateText)
-        if d is not None:
-            return d
-
-        # A 4-digit number all alone is a year
-        m=re.match(r"^(\d\d\d\d)$", dateText)  # Month + 2- or 4-digit year
-        if m is not None and m.groups() is not None and len(m.groups()) == 1:
-            y=ValidFannishYear(m.groups()[0])
-            if y != "0":
-                self.Year=y
-                return self
-
         # Look for mm/dd/yy and mm/dd/yyyy
-        m=re.match(r"^(\d{1,2})/(\d{1,2})/(\d{2}|\d{4})$", dateText)
-        if m is not None and m.groups() is not None and len(m.groups()) == 3:
-            g1t=m.groups()[0]
-            g2t=m.groups()[1]
-            yt=m.groups()[2]
+        # This is a common form in bulk data, so it is checked first, by splitting rather than with a regex
+        parts=dateText.split("/")
+        if len(parts) == 3 and 0 < len(parts[0]) < 3 and 0 < len(parts[1]) < 3 and len(parts[2]) in (2, 4) and \
+                parts[0].isdecimal() and parts[1].isdecimal() and parts[2].isdecimal():
+            g1t, g2t, yt=parts
             y=int(ValidFannishYear(yt))
             if y is not None:
                 # The US date format has the first group as the month and the second as the day.  See if this works.
@@ -420,14 +415,43 @@ class FanzineDate:
                     self.Day=d
                     return self
 
+        # Turn any long dashes and double hyphens into single hyphens
+        dateText=dateText.replace('—', '-')
+        dateText=dateText.replace('--', '-')
+
+        # There are some dates which follow no useful pattern.  Check for them
+        d=InterpretRandomDatestring(dateText)
+        if d is not None:
+            return d
+
+        # Every one of the patterns below ends in a digit, so if dateText doesn't, we can skip straight to the last resort
+        endsInDigit=dateText[-1].isdecimal()
+
+        # A 4-digit number all alone is a year
+        m=_RE_YEAR_ONLY.match(dateText) if endsInDigit else None
+        if m is not None:
+            y=ValidFannishYear(m.group(1))
+            if y != "0":
+                self.Year=y
+                return self
+
+        # Many of the remaining forms are some sort of text followed by a year.  Check for that once, up front.
+        textYear=_RE_TEXT_YEAR.match(dateText) if endsInDigit else None
+
         # Look for <month> <yy> or <yyyy> where month is a recognizable month name and the <y>s form a fannish year
         # Note that the mtext and ytext found here may be analyzed several different ways
-        m=re.match(r"^([\s\w\-',]+).?\s+(\d\d|\d\d\d\d)$", dateText)  # Month +[,] + 2- or 4-digit year
-        if m is not None and m.groups() is not None and len(m.groups()) == 2:
-            mtext=m.groups()[0].replace(","," ").replace("  ", " ")     # Turn a comma-space combination into a single space
-            ytext=m.groups()[1]
+        m=_RE_MONTH_YEAR.match(dateText) if textYear is not None else None  # Month +[,] + 2- or 4-digit year
+        if m is not None:
+            mtext=_RE_COMMA_WS.sub(" ", m.group(1)).strip()     # Turn a comma-space combination into a single space
+            ytext=m.group(2)
             y=ValidFannishYear(ytext)
             if y is not None and mtext is not None:
+                # Most often mtext is just a month name, which a single lookup will settle
+                month=_MONTH_INT_TABLE.get(mtext.lower())
+                if month is not None:
+                    self.Year=ytext
+                    self.Month=month
+                    return self
                 if InterpretMonth(mtext) is not None:
                     md=InterpretMonthDay(mtext)
                     if md is not None:
@@ -440,7 +464,7 @@ class FanzineDate:
             # Give them a try.
             if y is not None and mtext is not None:
                 # In this case the *last* token is assumed to be a month and all previous tokens to be the relative stuff
-                tokens=mtext.replace("-", " ").replace(",", " ").split()
+                tokens=mtext.translate(_SEPARATOR_TRANSLATION).split()
                 if tokens is not None and len(tokens) > 0:
                     modifier=" ".join(tokens[:-1])
                     mtext=tokens[-1:][0]
@@ -453,11 +477,11 @@ class FanzineDate:
                         return self
 
         # Annoyingly, the standard date parser doesn't like "." designating an abbreviated month name.  Deal with mmm. dd, yyyy
-        m=re.match(r"^([\s\w\-',]+).?\s+(\d+),?\s+(\d\d|\d\d\d\d)$", dateText)  # Month +[,] + 2- or 4-digit year
-        if m is not None and m.groups() is not None and len(m.groups()) == 3:
-            mtext=m.groups()[0].replace(","," ").replace("  ", " ")     # Turn a comma-space combination into a single space
-            dtext=m.groups()[1]
-            ytext=m.groups()[2]
+        m=_RE_MONTH_DAY_YEAR.match(dateText) if textYear is not None else None  # Month +[,] + 2- or 4-digit year
+        if m is not None:
+            mtext=_RE_COMMA_WS.sub(" ", m.group(1)).strip()     # Turn a comma-space combination into a single space
+            dtext=m.group(2)
+            ytext=m.group(3)
             y=ValidFannishYear(ytext)
             if y is not None and mtext is not None:
                 m=InterpretMonth(mtext)
@@ -469,11 +493,11 @@ class FanzineDate:
 
         # Look for <dd> <month> [,] <yyyy> where month is a recognizable month name and the <y>s form a fannish year
         # Note that the mtext and ytext found here may be analyzed several different ways
-        m=re.match(r"^(\d{1,2})\s+([\s\w\-',]+).?\s+(\d\d|\d\d\d\d)$", dateText)  # Month +[,] + 2- or 4-digit year
-        if m is not None and m.groups() is not None and len(m.groups()) == 3:
-            dtext=m.groups()[0]
-            mtext=m.groups()[1].replace(",", " ").replace("  ", " ")  # Turn a comma-space combination into a single space
-            ytext=m.groups()[2]
+        m=_RE_DAY_MONTH_YEAR.match(dateText) if textYear is not None else None  # Month +[,] + 2- or 4-digit year
+        if m is not None:
+            dtext=m.group(1)
+            mtext=_RE_COMMA_WS.sub(" ", m.group(2)).strip()  # Turn a comma-space combination into a single space
+            ytext=m.group(3)
             y=ValidFannishYear(ytext)
             if y is not None and mtext is not None:
                 m=InterpretMonth(mtext)
@@ -485,10 +509,9 @@ class FanzineDate:
 
         # There are some weird day/month formats (E.g., "St. Urho's Day 2013")
         # Look for a pattern of: <strange day/month> <year>
-        m=re.match(r"^(.+?)[,\s]+(\d\d|\d\d\d\d)$", dateText)  # random text + space + 2- or 4-digit year
-        if m is not None and m.groups() is not None and len(m.groups()) == 2:
-            mtext=m.groups()[0].replace(","," ").replace("  ", " ")     # Turn a comma-space combination into a single space
-            ytext=m.groups()[1]
+        if textYear is not None:
+            mtext=_RE_COMMA_WS.sub(" ", textYear["text"]).strip()     # Turn a comma-space combination into a single space
+            ytext=textYear["year"]
             y=ValidFannishYear(ytext)
             if y is not None and mtext is not None:
                 rslt=InterpretNamedDay(mtext)  # mtext was extracted by whichever pattern recognized the year and set y to non-None
@@ -496,23 +519,22 @@ class FanzineDate:
                     self.Year=y
                     self.Month=rslt[0]
                     self.Day=rslt[1]
-                    self.MonDayText=mtext
                     return self
 
         # There are a few annoying entries of the form "Winter 1951-52"  They all *appear* to mean something like January 1952
         # We'll try to handle this case
-        m=re.match(r"^Winter[,\s]+\d\d\d\d\s*-\s*(\d\d)$", dateText)
-        if m is not None and len(m.groups()) == 1:
-            return cls(Year=int(m.groups()[0]), Month=1, MonthText="Winter")  # Use the second part (the 4-digit year)
+        m=_RE_WINTER_YEARS.match(dateText) if endsInDigit else None
+        if m is not None:
+            return cls(Year=int(m.group(1)), Month=1, MonthText="Winter")  # Use the second part (the 4-digit year)
 
         # There are the equally annoying entries Month-Month year (e.g., 'June - July 2001') and Month/Month year.
         # These will be taken to mean the first month
         # We'll look for the pattern <text> '-' <text> <year> with (maybe) spaces between the tokens
-        m=re.match(r"^(\w+)\s*[-/]\s*(\w+)\s,?\s*(\d\d\d\d)$", dateText)
-        if m is not None and len(m.groups()) == 3:
-            month1=m.groups()[0]
-            month2=m.groups()[1]
-            year=m.groups()[2]
+        m=_RE_MONTH_MONTH_YEAR.match(dateText) if endsInDigit else None
+        if m is not None:
+            month1=m.group(1)
+            month2=m.group(2)
+            year=m.group(3)
             m=InterpretMonth(month1)
             y=int(year)
             if m is not None:
@@ -522,20 +544,20 @@ class FanzineDate:
                 return self
 
         # Next we'll look for yyyy-yy all alone
-        m=re.match(r"^\d\d\d\d\s*-\s*(\d\d)$", dateText)
-        if m is not None and len(m.groups()) == 1:
-            self.Year=int(m.groups()[0])
+        m=_RE_YEAR_YEAR.match(dateText) if endsInDigit else None
+        if m is not None:
+            self.Year=int(m.group(1))
             self.Month=1
             return self
             # Use the second part of the year, and given that this is yyyy-yy, it probably is a vaguely winterish date
 
         # Another form is the fannish "April 31, 1967" -- didn't want to miss that April mailing date!
         # We look for <month><number>,<year> with possible spaces between. Comma is optional.
-        m=re.match(r"^(\w+)\s+(\d+),?\s+(\d\d|\d\d\d\d)$", dateText)  # Month + Day, + 2- or 4-digit year
-        if m is not None and m.groups() is not None and len(m.groups()) == 3:
-            mtext=m.groups()[0]
-            dtext=m.groups()[1]
-            ytext=m.groups()[2]
+        m=_RE_WORD_DAY_YEAR.match(dateText) if textYear is not None else None  # Month + Day, + 2- or 4-digit year
+        if m is not None:
+            mtext=m.group(1)
+            dtext=m.group(2)
+            ytext=m.group(3)
             y=int(ValidFannishYear(ytext))
             m=InterpretMonth(mtext)
             d=InterpretDay(dtext)
@@ -556,16 +578,37 @@ class FanzineDate:
                     self.Year=d.year
                     self.Month=d.month
                     self.Day=d.day
-                    self.DateTime=d
                     return self
 
         # Nothing worked
         return self
 
 
+    # =============================================================================
+    # Parse a list of date strings, returning a list of FanzineDates in the same order.
+    # Bulk imports see the same date strings over and over, so each distinct string is parsed only once.
+    # Every entry in the returned list is a separate FanzineDate, so callers may safely modify them.
+    @classmethod
+    def MatchBatch(cls, strings: list[str], strict: bool=False, complete: bool=True) -> list[Self]:
+        parsed: dict[str, FanzineDate]={}
+        rslt: list[FanzineDate]=[]
+        for s in strings:
+            fd=parsed.get(s)
+            if fd is None:
+                fd=parsed[s]=cls.Match(s, strict=strict, complete=complete)
+                rslt.append(fd)
+                continue
+            fdCopy=cls()
+            fdCopy.Copy(fd)
+            rslt.append(fdCopy)
+        return rslt
+
+
 #$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 #$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 class FanzineDateRange:
+    __slots__=("_startdate", "_enddate", "_cancelled", "_useMarkupForCancelled")
+
     def __init__(self):
         self._startdate: FanzineDate|None=None
         self._enddate: FanzineDate|None=None
@@ -585,7 +628,7 @@ class FanzineDateRange:
 
     # -----------------------------
     def __hash__(self):
-        return hash(self._startdate)+hash(self._enddate)+hash(self._cancelled)
+        return hash((self._startdate, self._enddate, self._cancelled))
     #TODO:  What about _useMarkupForCancelled?
 
     # -----------------------------
@@ -610,21 +653,21 @@ class FanzineDateRange:
             s=str(d2)
         elif d1 is not None and d2 is None:
             s=str(d1)
-        elif d1.Year == d2.Year:
-            if d1.Month == d2.Month:
-                if d1.Month is None:
-                    s=str(d1.Year)
-                elif d1.Day == d2.Day:
-                    if d1.Day is None:
-                        s=MonthName(d1.Month)+" "+str(d1.Year)
-                    else:
-                        s=MonthName(d1.Month)+" "+str(d1.Day)+", "+str(d1.Year)
-                else:
-                    s=MonthName(d1.Month)+" "+str(d1.Day)+"-"+str(d2.Day)+", "+str(d1.Year)
-            else:
-                s=MonthName(d1.Month)+" "+str(d1.Day)+"-"+MonthName(d2.Month)+" "+str(d2.Day)+", "+str(d1.Year)
         else:
-            s=str(d1)+"-"+str(d2)
+            y1, m1, day1=d1._Year, d1._Month, d1._Day
+            m2, day2=d2._Month, d2._Day
+            if y1 != d2._Year:
+                s=f"{d1}-{d2}"
+            elif m1 != m2:
+                s=f"{MonthName(m1)} {day1}-{MonthName(m2)} {day2}, {y1}"
+            elif m1 is None:
+                s=str(y1)
+            elif day1 != day2:
+                s=f"{MonthName(m1)} {day1}-{day2}, {y1}"
+            elif day1 is None:
+                s=f"{MonthName(m1)} {y1}"
+            else:
+                s=f"{MonthName(m1)} {day1}, {y1}"
 
         if self._cancelled:
             if self._useMarkupForCancelled:
@@ -666,28 +709,26 @@ class FanzineDateRange:
         if m:
             self._cancelled=True
             self._useMarkupForCancelled=True
-            s=m.groups()[0]
+            s=m.group(1)
 
         # If we have a single "-", then the format is probably of the form:
         #   #1: <month+day>-<month+day> year  or
         #   #2: <month> <day>-<day> <year>
         #   #3: <day>-<day> <month>[,] <year>
         #   #4: <month+day> <year1> - <month+day> <year2>
-        s=s.replace("–", "-")   # Convert en-dash to hyphen
-        s=s.replace("—", "-")  # Convert em-dash to hyphen
-        s=s.replace("--", "-")  # Likewise double-hyphens
-        s=s.replace("  ", " ").replace("  ", " ")  # Collapse strings of spaces
-        s=s.replace(" -", "-").replace("- ", "-")  # Remove spaces around "-"
+        s=s.translate(_DASH_TRANSLATION)   # Convert en-dash and em-dash to hyphen
+        s=_RE_DASH_RUN.sub("-", s)  # Turn runs of hyphens into one and remove spaces around "-"
+        s=" ".join(s.split())  # Collapse strings of spaces
         if s.count("-") == 1:   # There's got to be exactly one hyphen for it to be an interpretable date range
 
             # Try format #1: <monthday>-<monthday> year  or
             # s2 should contain a full date, including year
             s1, s2=s.split("-")
-            d2=FanzineDate().Match(s2)
+            d2=FanzineDate.Match(s2)
             if not d2.IsEmpty() and not d2.Day is None and not d2.Month is None:
                 # Add s2's year to the end of s1
                 s1+=" "+str(d2.Year)
-                d1=FanzineDate().Match(s1)
+                d1=FanzineDate.Match(s1)
                 if not d1.IsEmpty() and not d1.Day is None and not d1.Month is None:
                     self._startdate=d1
                     self._enddate=d2
@@ -695,13 +736,13 @@ class FanzineDateRange:
 
             # Try format #2: <month> <day>-<day>[,] <year>
             # Split on blanks, then recombine the middle parts
-            slist=[s for s in re.split(r'[ \-,]+',s) if len(s) > 0]  # Split on spans of space, hyphen and comma; ignore empty splits
+            slist=s.translate(_SEPARATOR_TRANSLATION).split()  # Split on spans of space, hyphen and comma; ignore empty splits
             if len(slist) == 4:
                 m=slist[0]
                 if not IsInt(m):    # m must be a text month -- it can't be a number
                     y=slist[3]
-                    d1=FanzineDate().Match(m+" "+slist[1]+", "+y)
-                    d2=FanzineDate().Match(m+" "+slist[2]+", "+y)
+                    d1=FanzineDate.Match(m+" "+slist[1]+", "+y)
+                    d2=FanzineDate.Match(m+" "+slist[2]+", "+y)
                     if not d1.IsEmpty() and not d2.IsEmpty():
                         self._startdate=d1
                         self._enddate=d2
@@ -712,9 +753,9 @@ class FanzineDateRange:
             if len(slist) > 2:
                 if "-" in slist[0]:
                     s1, s2=slist[0].split("-")
-                    d1=FanzineDate().Match(s1+" "+slist[1]+" "+slist[2])
+                    d1=FanzineDate.Match(s1+" "+slist[1]+" "+slist[2])
                     if not d1.IsEmpty():
-                        d2=FanzineDate().Match(s2+" "+slist[1]+" "+slist[2])
+                        d2=FanzineDate.Match(s2+" "+slist[1]+" "+slist[2])
                         if not d2.IsEmpty():
                             self._startdate=d1
                             self._enddate=d2
@@ -722,16 +763,16 @@ class FanzineDateRange:
 
             # Well, then what about #4?
             slist=s.split("-")
-            d1=FanzineDate().Match(slist[0])
+            d1=FanzineDate.Match(slist[0])
             if not d1.IsEmpty():
-                d2=FanzineDate().Match(slist[1])
+                d2=FanzineDate.Match(slist[1])
                 if not d2.IsEmpty():
                     self._startdate=d1
                     self._enddate=d2
                     return self
 
         # Try just an ordinary single date
-        d=FanzineDate().Match(s)
+        d=FanzineDate.Match(s)
         if not d.IsEmpty():
             self._startdate=d
             self._enddate=d
@@ -772,27 +813,28 @@ class FanzineDateRange:
 # Deal with things of the form "June 20," and "20 June" and just "June"
 # Return a tuple of (month, day)
 # (Day defaults to 1 if no day was supplied.)
+@lru_cache(maxsize=1024)
 def InterpretMonthDay(s: str) -> tuple[int, int|None]|None:
     s=s.strip() # Get rid of leading and trailing blanks as they can't possibly be of interest
     s=s.removesuffix(",")    # Get rid of trailing comma
 
-    s=s.replace("    ", " ").replace("   ", " ").replace("  ", " ") # Turn runs of up to 24 spaces into a single space
+    s=" ".join(s.split())   # Turn any run of whitespace into a single space
 
     # We now handle three cases:
     #       <month> <day> (A month name followed by a space followed by a day number)
     #       <day> <month>
     #       <month>
-    pieces=s.split(" ")
+    pieces=s.split(" ", 2)     # We never need more than three pieces to tell if it's too many
+    if len(pieces) > 2:     # Currently uninterpretable
+        return None
+
+    m=MonthNameToInt(pieces[0])
     if len(pieces) == 1:
-        m=MonthNameToInt(pieces[0])
         if m is not None:
             return m, None
-
-    # Ok, we know that there are at least two pieces
-    if len(pieces) > 2:     # Currently uninterpretable
         return None
 
-    m=MonthNameToInt(pieces[0])
+    # Ok, we know that there are exactly two pieces
     if m is not None and IsInt(pieces[1]):
         return m, int(pieces[1])
 
@@ -805,6 +847,7 @@ def InterpretMonthDay(s: str) -> tuple[int, int|None]|None:
 
 # =================================================================================
 # If necessary, turn text month into an int
+@lru_cache(maxsize=1024)
 def InterpretMonth(monthData: str|int|None) -> int|None:
 
     if monthData is None:
@@ -834,20 +877,29 @@ def InterpretDay(dayData: int|str|None)-> int|None:
     if len(dayData.strip()) == 0:  # If it's blank, return None
         return None
 
+    day, failedText=_InterpretDayText(dayData)
+    if failedText is not None:
+        LogError("   ***Day conversion failed: '"+failedText+"'")
+    return day
+
+
+# The string-handling part of InterpretDay, cached.  As with _InterpretYearText, the caller does the logging.
+@lru_cache(maxsize=1024)
+def _InterpretDayText(dayData: str) -> tuple[int|None, str|None]:
     # Convert to int
     dayData=RemoveHTMLDebris(dayData)
     if len(dayData) == 0:
-        return None
+        return None, None
+    # The usual cases are a plain number or a named day, neither of which needs exception handling
+    if dayData.isdecimal():
+        return int(dayData), None
+    d=InterpretNamedDay(dayData)
+    if d is not None:
+        return d[0], None
     try:
-        day=int(dayData)
+        return int(dayData), None    # Catch the less usual forms int() will take, e.g., with a sign
     except:
-        d=InterpretNamedDay(dayData)
-        if d is None:
-            LogError("   ***Day conversion failed: '"+dayData+"'")
-            day=None
-        else:
-            day=d[0]
-    return day
+        return None, dayData
 
 
 # =================================================================================
@@ -881,21 +933,19 @@ def ValidateData(val: str, valtype: str) -> int:
 
 
 # =================================================================================
-def MonthLength(m: int, year: int=None) -> int:
+_MONTH_LENGTHS=(0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)     # Indexed by month number; February is fixed up for leap years below
+
+def MonthLength(m: int, year: int=None) -> int|None:
     if m == 2:
         if year is None:  # Missing year is probably a non-leap year
             return 28
         if year%4 != 0:    # It's definitely a non-leap year
             return 28
-        if year == 2000:   # It's a special century leap year
-            return 29
-        return 29       # It must be an ordinary leap year then
+        return 29       # It must be a leap year then (2000 was a special century leap year)
 
-    if m in [4, 6, 9, 11]:      # Thirty days hath September...
-        return 30
-    if m in [1, 3, 5, 7, 8, 10, 12]:        # All the rest have 31...
-        return 31
-    assert False    # Crash and burn
+    if 1 <= m <= 12:
+        return _MONTH_LENGTHS[m]
+    return None     # Not a month
 
 # =================================================================================
 # Make sure day is within month
@@ -910,10 +960,6 @@ def BoundDay(d: int|None, m: int|None, y: int|None=None) -> tuple[int|None, int|
     if d < -10 or d > 60:   # Dates this far off the month are more probably typos than deliberate.
         return None, None, None
 
-    # Deal with the normal case
-    if 1 <= d <= MonthLength(m, year=y):
-        return d, m, y
-
     # Deal with negative days
     if d < 1:
         while d < 1:
@@ -921,57 +967,73 @@ def BoundDay(d: int|None, m: int|None, y: int|None=None) -> tuple[int|None, int|
             if m < 1:
                 m=12
                 y=y-1
-            d=d+MonthLength(m, year=y)
+            monthLength=MonthLength(m, year=y)
+            if monthLength is None:     # Not a real month
+                return None, None, None
+            d=d+monthLength
+        return d, m, y
+
+    # Deal with the normal case
+    monthLength=MonthLength(m, year=y)
+    if monthLength is None:     # Not a real month
+        return None, None, None
+    if d <= monthLength:
         return d, m, y
 
     # The day is past the end of the month.  Move it to the next month.
-    while d > MonthLength(m, year=y):
-        d=d-MonthLength(m, year=y)
+    while d > monthLength:
+        d=d-monthLength
         m=m+1
         if m > 12:
             m=1
             y=y+1
+        monthLength=MonthLength(m, year=y)
 
     return d, m, y
 
 
 # ====================================================================================
+# Lower-case month names, abbreviations and seasons mapped to the month number they designate
+# This is built once, at import time, since month lookup is on the hot path of date parsing
+_MONTH_INT_TABLE: dict[str, int]={"jan": 1, "january": 1, "1": 1,
+                                  "feb": 2, "february": 2, "feburary": 2, "2": 2,
+                                  "mar": 3, "march": 3, "3": 3,
+                                  "apr": 4, "april": 4, "4": 4,
+                                  "may": 5, "5": 5,
+                                  "jun": 6, "june": 6, "6": 6,
+                                  "jul": 7, "july": 7, "7": 7,
+                                  "aug": 8, "august": 8, "8": 8,
+                                  "sep": 9, "sept": 9, "september": 9, "9": 9,
+                                  "oct": 10, "october": 10, "10": 10,
+                                  "nov": 11, "november": 11, "11": 11,
+                                  "dec": 12, "december": 12, "12": 12,
+                                  "1q": 1, "q1": 1,
+                                  "4q": 4, "q2": 4, "2q": 4,
+                                  "7q": 7, "q3": 7, "3q": 7,    # 4q, 7q, 10q is for some fapazines which are numbered by an odd mix of quarter and month.
+                                  "10q": 10, "q4": 10,
+                                  "spring": 4, "spr": 4,
+                                  "summer": 7, "sum": 7,
+                                  "fall": 10, "autumn": 10, "fal": 10,
+                                  "winter": 1, "win": 1,
+                                  "xmas": 12, "christmas": 12}
+
 # Convert a text month to integer
+@lru_cache(maxsize=1024)
 def MonthNameToInt(text: str) -> int|None:
-    monthConversionTable={"jan": 1, "january": 1, "1": 1,
-                          "feb": 2, "february": 2, "feburary": 2, "2": 2,
-                          "mar": 3, "march": 3, "3": 3,
-                          "apr": 4, "april": 4, "4": 4,
-                          "may": 5, "5": 5,
-                          "jun": 6, "june": 6, "6": 6,
-                          "jul": 7, "july": 7, "7": 7,
-                          "aug": 8, "august": 8, "8": 8,
-                          "sep": 9, "sept": 9, "september": 9, "9": 9,
-                          "oct": 10, "october": 10, "10": 10,
-                          "nov": 11, "november": 11, "11": 11,
-                          "dec": 12, "december": 12, "12": 12,
-                          "1q": 1, "q1": 1,
-                          "4q": 4, "q2": 4, "2q": 4,
-                          "7q": 7, "q3": 7, "3q": 7,    # 4q, 7q, 10q is for some fapazines which are numbered by an odd mix of quarter and month.
-                          "10q": 10, "q4": 10,
-                          "spring": 4, "spr": 4,
-                          "summer": 7, "sum": 7,
-                          "fall": 10, "autumn": 10, "fal": 10,
-                          "winter": 1, "win": 1,
-                          "xmas": 12, "christmas": 12}
-
     text=text.replace(" ", "").lower()
 
-    # First look to see if the input is two month names separated by a non-alphabetic character (e.g., "September-November"
-    m=re.match("^([a-z]+)[-/]([a-z]+)$", text)
-    if m is not None and len(m.groups()) == 2 and len(m.groups()[0]) > 0:
-        m1=MonthNameToInt(m.groups()[0])
-        m2=MonthNameToInt(m.groups()[1])
-        if m1 is not None and m2 is not None:
-            return math.ceil((m1+m2)/2)
+    # The usual case is a single month name, which is a simple lookup
+    month=_MONTH_INT_TABLE.get(text)
+    if month is not None:
+        return month
 
-    with suppress(Exception):
-        return monthConversionTable[text]
+    # Otherwise look to see if the input is two month names separated by a non-alphabetic character (e.g., "September-November"
+    m=_RE_MONTH_RANGE.match(text)
+    if m is not None and len(m.group(1)) > 0:
+        m1=MonthNameToInt(m.group(1))
+        m2=MonthNameToInt(m.group(2))
+        if m1 is not None and m2 is not None:
+            return -(-(m1+m2)//2)     # Integer ceiling of the midpoint
 
     return None
 
@@ -1013,15 +1075,17 @@ def CreateRawText(dayText: str, monthText: str, yearText: str) -> str:
     ye=yearText.strip() if yearText is not None else ""
 
     # The format depends on what's known and what's not, and also depends on wether the month and day representations are strings of numbers ("7") or include other characters ("July")
-    if IsNumeric(mo) and IsNumeric(da):
-        return mo+"/"+da+"/"+ye             # 7/4/1776
-    elif not IsNumeric(mo) and IsNumeric(da):
-        return mo+" "+da+", "+ye            # July 4, 1776
-    elif IsNumeric(mo) and da == "":
-        return MonthName(int(mo))+" "+ye    # July 1776
+    moNumeric=IsNumeric(mo)
+    daNumeric=IsNumeric(da)
+    if moNumeric and daNumeric:
+        return f"{mo}/{da}/{ye}"             # 7/4/1776
+    elif not moNumeric and daNumeric:
+        return f"{mo} {da}, {ye}"            # July 4, 1776
+    elif moNumeric and da == "":
+        return f"{MonthName(int(mo))} {ye}"  # July 1776
     else:
-        # Text month and day.
-        return (mo+" ").lstrip()+(da+" ").lstrip()+ye  # The lstrip() gets rid of the extra space if mo or da is null
+        # Text month and day.  A missing month or day contributes neither itself nor its trailing space.
+        return f"{mo+' ' if mo else ''}{da+' ' if da else ''}{ye}"
 
 # =================================================================================
 # Convert 2-digit years to four digit years
@@ -1034,15 +1098,13 @@ def YearAs4Digits(year: int|str|None)-> int|None:
             year=int(year)
         except:
             return year
-    if year > 100:
-        return year
-    if year < 33:
-        return year+2000
-    return year+1900
+    # Four-digit years pass through; 00-32 are 2000s and 33-99 are 1900s
+    return year if year > 100 else year+(2000 if year < 33 else 1900)
 
 
 # =================================================================================
 # Take a string which supposedly designates a year and return either a valid fannish year or None
+@lru_cache(maxsize=1024)
 def ValidFannishYear(ytext: str) -> str:
     if ytext is None:
         return "0"  # error
@@ -1072,16 +1134,28 @@ def InterpretYear(yearText: int|str|None)-> int|str|None:
     if len(yearText.strip()) == 0:  # If it's blank, return 0
         return None
 
+    year, failedText=_InterpretYearText(yearText)
+    if failedText is not None:
+        LogError("   ***Year conversion failed: '"+failedText+"'")
+    return year
+
+
+# The string-handling part of InterpretYear.  It's pure, so it's cached; the logging is left to InterpretYear so that every failure is still reported.
+# Returns the year and, if the conversion failed, the cleaned-up text which couldn't be converted.
+@lru_cache(maxsize=1024)
+def _InterpretYearText(yearText: str) -> tuple[int|None, str|None]:
     yearText=RemoveHTMLDebris(yearText)  # We treat <br> and </br> as whitespace, also
     if len(yearText) == 0:
-        return None
+        return None, None
 
     # Drop up to two trailing question mark(s)
     yearText=yearText.removesuffix("?").removesuffix("?")
 
-    # Convert to int
+    # Convert to int.  The usual case is a plain string of digits, which needs no exception handling.
+    if yearText.isdecimal():
+        return YearAs4Digits(int(yearText)), None
     try:
-        return YearAs4Digits(int(yearText))
+        return YearAs4Digits(int(yearText)), None
     except:
         # OK, that failed. Could it be because it's something like '1953-54'?
         with suppress(Exception):
@@ -1092,10 +1166,9 @@ def InterpretYear(yearText: int|str|None)-> int|str|None:
                 if len(years) == 2:
                     y1=YearAs4Digits(int(years[0]))
                     y2=YearAs4Digits(int(years[1]))
-                    return max(y1, y2)
+                    return max(y1, y2), None
 
-    LogError("   ***Year conversion failed: '"+yearText+"'")
-    return None
+    return None, yearText
 
 # Format an integer month as text
 def MonthName(month: int, short=False) -> str:
@@ -1135,126 +1208,122 @@ def YearName(year: int|str|None)-> str:
 #  Handle dates like "Thanksgiving"
 # Returns a month/day tuple which will often be exactly correct and rarely off by enough to matter
 # Note that we don't (currently) attempt to handle moveable feasts by taking the year in account
+# Lower-case named days mapped to their (month, day)
+_NAMED_DAY_TABLE: dict[str, tuple[int|None, int|None]]={
+    "unknown": (None, None),
+    "unknown ?": (None, None),
+    "new year's day": (1, 1),
+    "edgar allen poe's birthday": (1, 19),
+    "edgar allan poe's birthday": (1, 19),
+    "edgar alan poe's birthday": (1, 19),
+    "groundhog day": (2, 4),
+    "daniel yergin day": (2, 6),
+    "canadian national flag day": (2, 15),
+    "national flag day": (2, 15),
+    "chinese new year": (2, 15),
+    "lunar new year": (2, 15),
+    "leap day": (2, 29),
+    "late february or early march": (3, None),
+    "ides of march": (3, 15),
+    "st urho's day": (3, 16),
+    "st. urho's day": (3, 16),
+    "saint urho's day": (3, 16),
+    "vernal equinox": (3, 20),
+    "spring equinox": (3, 20),
+    "april fool's day": (4, 1),
+    "good friday": (4, 8),
+    "solar eclipse": (4,8),     # 2024 only...
+    "easter": (4, 10),
+    "national garlic day": (4, 19),
+    "world free press day": (5, 3),
+    "cinco de mayo": (5, 5),
+    "victoria day": (5, 22),
+    "world no tobacco day": (5, 31),
+    "world environment day": (6, 5),
+    "great flood": (6, 19),  # Opuntia, 2013 Calgary floods
+    "summer solstice": (6, 21),
+    "world wide party": (6, 21),
+    "canada day": (7, 1),
+    "stampede": (7, 10),
+    "stampede rodeo": (7, 10),
+    "stampede parade": (7, 10),
+    "calgary stampede parade": (7, 10),
+    "system administrator appreciation day": (7, 25),
+    "apres le deluge": (8, 1),  # Opuntia, 2013 Calgary floods
+    "august 14 to 16": (8, 15),
+    "international whale shark day": (8, 30),
+    "labor day": (9, 3),
+    "labour day": (9, 3),
+    "september 15 to 18": (9, 17),
+    "september 17 to 20": (9, 19),
+    "autumn equinox": (9, 20),
+    "fall equinox": (9, 20),
+    "(canadian) thanksgiving": (10, 15),
+    "halloween": (10, 31),
+    "october (halloween)": (10, 31),
+    "remembrance day": (11, 11),
+    "rememberance day": (11, 11),
+    "thanksgiving": (11, 24),
+    ''"around the end"'': (12, None),
+    "november (december)": (12, None),
+    "before christmas december": (12, 15),
+    "saturnalia": (12, 21),
+    "winter solstice": (12, 21),
+    "christmas": (12, 25),
+    "christmas issue": (12, 25),
+    "christmas issue december": (12, 25),
+    "xmas ish the end of december": (12, 25),
+    "boxing day": (12, 26),
+    "hogmanay": (12, 31),
+    "auld lang syne": (12, 31),
+    ''"over year end"'': (12, 31)
+}
+
+@lru_cache(maxsize=1024)
 def InterpretNamedDay(dayString: str) -> tuple[int, int]|None:
-    namedDayConversionTable={
-        "unknown": (None, None),
-        "unknown ?": (None, None),
-        "new year's day": (1, 1),
-        "edgar allen poe's birthday": (1, 19),
-        "edgar allan poe's birthday": (1, 19),
-        "edgar alan poe's birthday": (1, 19),
-        "groundhog day": (2, 4),
-        "daniel yergin day": (2, 6),
-        "canadian national flag day": (2, 15),
-        "national flag day": (2, 15),
-        "chinese new year": (2, 15),
-        "lunar new year": (2, 15),
-        "leap day": (2, 29),
-        "Late february or early march": (3, None),
-        "ides of march": (3, 15),
-        "st urho's day": (3, 16),
-        "st. urho's day": (3, 16),
-        "saint urho's day": (3, 16),
-        "vernal equinox": (3, 20),
-        "spring equinox": (3, 20),
-        "april fool's day": (4, 1),
-        "good friday": (4, 8),
-        "solar eclipse": (4,8),     # 2024 only...
-        "easter": (4, 10),
-        "national garlic day": (4, 19),
-        "world free press day": (5, 3),
-        "cinco de mayo": (5, 5),
-        "victoria day": (5, 22),
-        "world no tobacco day": (5, 31),
-        "world environment day": (6, 5),
-        "great flood": (6, 19),  # Opuntia, 2013 Calgary floods
-        "summer solstice": (6, 21),
-        "world wide party": (6, 21),
-        "canada day": (7, 1),
-        "stampede": (7, 10),
-        "stampede rodeo": (7, 10),
-        "stampede parade": (7, 10),
-        "calgary stampede parade": (7, 10),
-        "system administrator appreciation day": (7, 25),
-        "apres le deluge": (8, 1),  # Opuntia, 2013 Calgary floods
-        "august 14 to 16": (8, 15),
-        "international whale shark day": (8, 30),
-        "labor day": (9, 3),
-        "labour day": (9, 3),
-        "september 15 to 18": (9, 17),
-        "september 17 to 20": (9, 19),
-        "autumn equinox": (9, 20),
-        "fall equinox": (9, 20),
-        "(canadian) thanksgiving": (10, 15),
-        "halloween": (10, 31),
-        "october (halloween)": (10, 31),
-        "remembrance day": (11, 11),
-        "rememberance day": (11, 11),
-        "thanksgiving": (11, 24),
-        ''"around the end"'': (12, None),
-        "november (december)": (12, None),
-        "before christmas december": (12, 15),
-        "saturnalia": (12, 21),
-        "winter solstice": (12, 21),
-        "christmas": (12, 25),
-        "christmas issue": (12, 25),
-        "christmas issue december": (12, 25),
-        "xmas ish the end of december": (12, 25),
-        "boxing day": (12, 26),
-        "hogmanay": (12, 31),
-        "auld lang syne": (12, 31),
-        ''"over year end"'': (12, 31)
-    }
-    with suppress(Exception):
-        return namedDayConversionTable[dayString.lower().replace(",", "")]
-
-    return None
+    # A miss returns None; a hit may legitimately be (None, None), which is not the same thing
+    return _NAMED_DAY_TABLE.get(dayString.lower().replace(",", ""))
 
 
 # ====================================================================================
 # Deal with situations like "late December"
 # We replace the vague relative term by a non-vague (albeit unreasonably precise) number
+_RELATIVE_WORDS_TABLE: dict[str, int]={
+    "start of": 1,
+    "early": 7,
+    "early in": 7,
+    "mid": 15,
+    "middle": 15,
+    "?": 15,
+    "middle late": 19,
+    "late": 24,
+    "end of": 30,
+    "the end of": 30,
+    "around the end of": 30
+}
+
+@lru_cache(maxsize=1024)
 def InterpretRelativeWords(daystring: str) -> int|None:
-    conversionTable={
-        "start of": 1,
-        "early": 7,
-        "early in": 7,
-        "mid": 15,
-        "middle": 15,
-        "?": 15,
-        "middle late": 19,
-        "late": 24,
-        "end of": 30,
-        "the end of": 30,
-        "around the end of": 30
-    }
-
-    with suppress(Exception):
-        return conversionTable[daystring.replace(",", " ").replace("-", " ").lower()]
-
-    return None
+    return _RELATIVE_WORDS_TABLE.get(daystring.replace(",", " ").replace("-", " ").lower())
 
 
 # =============================================================================
 # Take various text versions of a month and convert them to the full-out spelling
-def StandardizeMonth(month: str) -> str:
-    table={"1": "January", "jan": "January",
-           "2": "February", "feb": "February",
-           "3": "March", "mar": "March",
-           "4": "April", "apr": "April",
-           "5": "May",
-           "6": "June", "jun": "June",
-           "7": "July", "jul": "july",
-           "8": "August", "aug": "August",
-           "9": "September", "sep": "September",
-           "10": "October", "oct": "October",
-           "11": "November", "nov": "November",
-           "12": "December", "dec": "December"}
-
-    if month.lower().strip() not in table.keys():
-        return month
+_MONTH_STD_TABLE: dict[str, str]={"1": "January", "jan": "January",
+                                   "2": "February", "feb": "February",
+                                   "3": "March", "mar": "March",
+                                   "4": "April", "apr": "April",
+                                   "5": "May",
+                                   "6": "June", "jun": "June",
+                                   "7": "July", "jul": "July",
+                                   "8": "August", "aug": "August",
+                                   "9": "September", "sep": "September",
+                                   "10": "October", "oct": "October",
+                                   "11": "November", "nov": "November",
+                                   "12": "December", "dec": "December"}
 
-    return table[month.lower().strip()]
+def StandardizeMonth(month: str) -> str:
+    return _MONTH_STD_TABLE.get(month.lower().strip(), month)
 
 
 
@@ -1281,7 +1350,7 @@ def ToDatetime(text: str= "") -> datetime|None:
         locsp=text[:loccol].rfind(" ")
         timetext=text[locsp:].strip()
         datetext=text[:locsp].strip()
-    date=FanzineDate().Match(datetext)
+    date=FanzineDate.Match(datetext)
     td=None
     if timetext != "":
         time=datetime.strptime(timetext, "%I:%M:%S %p")
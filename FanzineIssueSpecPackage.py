@@ -21,19 +21,45 @@
 from __future__ import annotations
 
 import re
-from contextlib import suppress
+from functools import lru_cache
 from datetime import datetime
+from collections.abc import Callable
 
 from Locale import Locale
 from FanzineDateTime import FanzineDate, MonthNameToInt
 
 from Log import Log, LogError
-from HelpersPackage import ToNumeric, IsInt
+from HelpersPackage import ToNumeric
 from HelpersPackage import Pluralize
 from HelpersPackage import InterpretNumber, InterpretRoman, InterpretInteger
 from HelpersPackage import CaseInsensitiveCompare
 from HelpersPackage import ParmDict
 
+_Debug: bool=False      # Set to True to print debugging traces (e.g., of FanzineIssueSpecList.GetTrailingSerial's progress)
+
+
+# The serial number formats recognized by FanzineSerial.Match, as a single alternation.
+# Each format is a named group, so m.lastgroup tells which one matched.  (The alternatives are tried in order, and the first match wins.)
+_RE_SERIAL=re.compile(
+    r"(?P<VNum>V(?P<VNumVol>\d+)\s*#(?P<VNumNum>\d+)(?P<VNumSuffix>\w?))"                                  # Vnnn #mmm[a]
+    r"|(?P<VolNum>V[oO][lL]\s*(?P<VolNumVol>\d+)\s*#(?P<VolNumNum>\d+)(?P<VolNumSuffix>\w?)$)"             # Vol nnn #mmm[a]
+    r"|(?P<Fraction>(?P<FractionWhole>\d+)\s+(?P<FractionNumerator>\d+)/(?P<FractionDenominator>\d+)$)"   # nnn nnn/nnn
+    r"|(?P<VolSlashNum>(?P<VolSlashNumVol>\d+)/(?P<VolSlashNumNum>\d+)$)"                                 # nnn/nnn
+    r"|(?P<RomanSlashNum>(?P<RomanSlashNumVol>[IVXLC]+)/(?P<RomanSlashNumNum>\d+)$)"                       # rrr/nnn
+    r"|(?P<WholeRange>(?P<WholeRangeStart>\d+)-\d+$)"                                                      # nnn-nnn
+    r"|(?P<HashWhole>#(?P<HashWholeWhole>\d+)$)"                                                           # #nnn
+    r"|(?P<TrailingDecimal>.*?(?P<TrailingDecimalNum>\d+\.\d+)$)")                                         # ...nn.mm
+_SERIAL_START_CHARS="#IVXLC"    # The non-digit characters which can begin one of _RE_SERIAL's formats other than the trailing decimal
+# The looser formats, which are only tried when matching is neither strict nor complete
+_RE_TRAILING_SERIAL=re.compile(
+    r"(?P<TrailingWhole>.*?(?P<TrailingWholeWhole>[0-9]+)(?P<TrailingWholeSuffix>[a-zA-Z]?)\s*$)"          # ...nnn[a]
+    r"|(?P<TrailingRoman>.*?\s+(?P<TrailingRomanNum>[IVXLC]+)\s*$)")                                       # ... rrr
+_TRAILING_SERIAL_END_CHARS="0123456789IVXLC"     # One of the looser formats can only match if the text ends in one of these, or in a digit plus a letter
+
+_RE_DIGITS=re.compile(r"^(\d+)$")                                  # A number standing by itself
+_RE_SERIAL_PREFIX=re.compile(r"\s*(?:#|[Vv](?:[oO][lL])?\s*\d)")     # The start of a serial which can't be the start of a date
+_RE_YEAR=re.compile(r"^\d{4}$")                                    # A 4-digit year
+
 class FanzineCounts:
     def __init__(self, Titlecount: int=0, Issuecount: int=0, Pagecount: int=0, Pdfcount: int=0, Pdfpagecount: int=0, Title: str=None, Titlelist: set[str]=None):
 
@@ -351,6 +377,7 @@ class FanzineSeriesInfo:
 #$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 class FanzineSerial:
+    __slots__=("_Vol", "_Num", "_Whole", "_WSuffix", "_NumSuffix")
 
     def __init__(self, Vol: None|int|str=None, Num: None|int|str|float=None, NumSuffix: str|None="", Whole:None|int|str|float=None, WSuffix: str|None="") -> None:
         self._Vol=None
@@ -418,39 +445,16 @@ class FanzineSerial:
     def __lt__(self, other: FanzineSerial) -> bool:             # FanzineSerial
         if other is None:
             return False
-        # If both have Wholes, use Whole for the comparison
-        if self._Whole is not None and other._Whole is not None:
-            if self._Whole < other._Whole:
-                return True
-            if self._Whole > other._Whole:
-                return False
-
-            # Can the suffixes provide a tie breaker?
-            if self._WSuffix is not None or other._WSuffix is not None:
-                # OK, the Wholes are equal.  Can the suffixs (e.g., #133 and #133A) be used to distinguish?  Suffixed Wholes are always larger.
-                if other._WSuffix is None:
-                    return False            # If other is None it can't be less that self, even if self, also, is None
-                if self._WSuffix is None:
-                    return True             # Other has a suffix and self doesn't, so self is less than other
-                # Both have suffixes
-                return self._WSuffix < other._WSuffix
-
-        # Wholes were no help
-        if self._Vol is not None and other._Vol is not None:
-            if self._Vol < other._Vol:
-                return True
-            if self._Vol > other._Vol:
-                return False
-            # The Vols are equal; Check the numbers within the volume
-            if self._Num is None and other._Num is None:
-                return False
-            if self._Num is None and other._Num is not None:
-                return True
-            if self._Num is not None and other._Num is None:
-                return False
+        return self.SortKey() < other.SortKey()
 
-        # Who knows?
-        return False
+    # -----------------------------
+    # The tuple that __lt__ compares: Whole (then its suffix), then Vol, then Num (then its suffix)
+    # A missing value is wrapped as (0,) and a present one as (1, value) so that missing values sort first and None is never compared with a number.
+    # Use it directly as a sort key (e.g., sorted(serials, key=FanzineSerial.SortKey)) in preference to FormatSerialForSorting()
+    def SortKey(self) -> tuple:             # FanzineSerial
+        return ((0,) if self._Whole is None else (1, self._Whole), self._WSuffix,
+                (0,) if self._Vol is None else (1, self._Vol),
+                (0,) if self._Num is None else (1, self._Num), self._NumSuffix)
 
     # -----------------------------
     def Copy(self, other: FanzineSerial) -> None:             # FanzineSerial
@@ -465,7 +469,12 @@ class FanzineSerial:
     def SetIntProperty(self, val: None|int|str) -> int|None:
         if val is None:
             return None
-        elif isinstance(val, str):
+        # The usual cases are an int or a string of digits, which don't need the full generality of ToNumeric()
+        if type(val) is int:
+            return val
+        if isinstance(val, str):
+            if val.isdecimal():
+                return int(val)
             return ToNumeric(val)
         return val
 
@@ -520,17 +529,8 @@ class FanzineSerial:
     # .....................
     # Does this instance have anything defined for the serial number?
     def IsEmpty(self) -> bool:             # FanzineSerial
-        if self._NumSuffix is not None and len(self._NumSuffix) > 0:
-            return False
-        if self._Num is not None:
-            return False
-        if self._Whole is not None:
-            return False
-        if self._Vol is not None:
-            return False
-        if self._WSuffix is not None and len(self._WSuffix) > 0:
-            return False
-        return True
+        # The numeric fields are what's normally filled in, so check them first.  (The suffix setters turn None into "".)
+        return self._Num is None and self._Whole is None and self._Vol is None and not self._NumSuffix and not self._WSuffix
 
     # .......................
     # Convert the FanzineIssueSpec into a debugging form
@@ -588,47 +588,49 @@ class FanzineSerial:
         # If there's no volume specified, Volume is None and Number is the whole number
         # If we can't make sense of it, return (None, None), so if the 2nd member of the tuple is None, conversion failed.
     def DecodeIssueDesignation(self, s: str) -> tuple[ int|None, int|None ]:            
-        with suppress(Exception):
+        # We make a single left-to-right pass over the string.  The forms accepted are:
+        #       [#]nnn                      -- a whole number
+        #       [#][v]nnn<delims>mmm        -- a volume and number, where <delims> is any span of ' ', '.', and '#'
+        s=s.strip().lower()
+        if s.isdecimal():
             return None, int(s)
 
-        # Ok, it's not a simple number.  Drop leading and trailing spaces and see if it of the form #nn
-        s=s.strip().lower()
-        if len(s) == 0:
-            return None, None
-        if s[0] == "#":
-            s=s[1:]
-            if len(s) == 0:
-                return None, None
-            with suppress(Exception):
-                return None, int(s)
+        # Skip a leading '#'.  If what follows is just a number, it's a whole number.
+        length=len(s)
+        i=0
+        if length > 0 and s[0] == "#":
+            i=1
+            if s[1:].lstrip().isdecimal():
+                return None, int(s[1:])
 
         # This exhausts the single number possibilities
-        # Maybe it's of the form Vnn, #nn (or Vnn.nn or Vnn,#nn)
-
-        # Strip any leading 'v'
-        if len(s) == 0:
-            return None, None
-        if s[0] == "v":
-            s=s[1:]
-            if len(s) == 0:
-                return None, None
-
-        # The first step is to see if there's at least one of the characters ' ', '.', and '#' in the middle
-        # We split the string in two by a span of " .#"
-        # Walk through the string until we;ve passed the first span of digits.  Then look for a span of " .#". The look for at least one more digit.
-        # Since we've dropped any leading 'v', we kno we must be of the form nn< .#>nnn
-        # So if the first character is not a digit, we give up.
-        if not s[0].isdigit():
+        # Maybe it's of the form Vnn, #nn (or Vnn.nn or Vnn,#nn).  Skip any leading 'v'
+        if i < length and s[i] == "v":
+            i+=1
+
+        # Now we need a span of digits, a span of delimiters, and another span of digits.  (Trailing delimiters are harmless.)
+        start=i
+        while i < length and s[i].isdecimal():
+            i+=1
+        vol=s[start:i]
+
+        start=i
+        while i < length and (s[i] in ".#" or s[i].isspace()):
+            i+=1
+        if i == start:
             return None, None
 
-        # Now, the only legitimate character other than digits are the three delimiters, so translate them all to blanks and then split into the two digit strings
-        spl=s.replace(".", " ").replace("#", " ").split()
-        if len(spl) != 2:
-            return None, None
-        with suppress(Exception):
-            return int(spl[0]), int(spl[1])
+        start=i
+        while i < length and s[i].isdecimal():
+            i+=1
+        num=s[start:i]
 
-        return None, None
+        while i < length and (s[i] in ".#" or s[i].isspace()):
+            i+=1
+
+        if len(vol) == 0 or len(num) == 0 or i != length:
+            return None, None
+        return int(vol), int(num)
 
 
     # =============================================================================
@@ -668,90 +670,65 @@ class FanzineSerial:
     #       ...nn[ ]
     @classmethod
     def Match(cls, s: str, scan: bool=False, strict: bool=False, complete: bool=False):             # FanzineSerial
-        s=s.strip()     # Remove leading and trailing whitespace
-
-        # First look for a Vol+Num designation: Vnnn #mmm
-        pat=r"^V(\d+)\s*#(\d+)(\w?)"
-        # # Leading junk
-        # Vnnn + optional whitespace
-        # #nnn + optional single alphabetic character suffix
-        m=re.match(pat, s)
-        if m is not None and len(m.groups()) in [2, 3]:
-            ns=None
-            if len(m.groups()) == 3:
-                ns=m.groups()[2]
-            return cls(Vol=int(m.groups()[0]), Num=int(m.groups()[1]), NumSuffix=ns)
-
-        #
-        #  Vol (or VOL) + optional space + nnn + optional comma + optional space
-        # + #nnn + optional single alphabetic character suffix
-        m=re.match(r"V[oO][lL]\s*(\d+)\s*#(\d+)(\w?)$", s)
-        if m is not None and len(m.groups()) in [2, 3]:
-            ns=None
-            if len(m.groups()) == 3:
-                ns=m.groups()[2]
-            return cls(Vol=int(m.groups()[0]), Num=int(m.groups()[1]), NumSuffix=ns)
-
-        # Now look for nnn nnn/nnn (fractions!)
-        # nnn + mandatory whitespace + nnn + slash + nnn * optional whitespace
-        m=re.match(r"^(\d+)\s+(\d+)/(\d+)$", s)
-        if m is not None and len(m.groups()) == 3:
-            return cls(Whole=int(m.groups()[0])+int(m.groups()[1])/int(m.groups()[2]))
-
-        # Now look for nnn/nnn (which is understood as vol/num
-        # Leading stuff + nnn + slash + nnn * optional whitespace
-        m=re.match(r"^(\d+)/(\d+)$", s)
-        if m is not None and len(m.groups()) == 2:
-            return cls(Vol=int(m.groups()[0]), Num=int(m.groups()[1]))
-
-        # Now look for xxx/nnn, where xxx is in Roman numerals
-        # Leading whitespace + roman numeral characters + slash + nnn + whitespace
-        m=re.match(r"^([IVXLC]+)/(\d+)$", s)
-        if m is not None and len(m.groups()) == 2:
+        # The parsing is done (and cached) by _MatchSerial, since the same serials turn up over and over
+        # Only whether we're allowed the looser formats matters to the parse, so that's all that's passed on
+        return cls(*_MatchSerial(s.strip(), not strict and not complete))
+
+
+# =============================================================================================
+# Parse a (stripped) string as a serial for FanzineSerial.Match
+# The result is the tuple of arguments -- (Vol, Num, NumSuffix, Whole, WSuffix) -- to construct the FanzineSerial with.
+# (FanzineSerials are mutable, so we cache these rather than the FanzineSerials themselves.)
+@lru_cache(maxsize=4096)
+def _MatchSerial(s: str, loose: bool) -> tuple[int|float|None, int|float|None, str, int|float|None, str]:
+    # The formats are tried in order, and the first one which matches decides how s is interpreted
+    # All but the last of them must start with a digit, "#" or a Roman numeral character, and the last needs a "."; if none of that is so, don't bother
+    c0=s[:1]
+    m=None
+    if c0 != "" and (c0 in _SERIAL_START_CHARS or c0.isdecimal() or "." in s):
+        m=_RE_SERIAL.match(s)
+    if m is not None:
+        form=m.lastgroup
+        # A Vol+Num designation: Vnnn #mmm or Vol nnn #mmm, with an optional single alphabetic character suffix
+        if form == "VNum" or form == "VolNum":
+            return int(m[form+"Vol"]), int(m[form+"Num"]), m[form+"Suffix"], None, ""
+        # nnn nnn/nnn (fractions!)
+        if form == "Fraction":
+            return None, None, "", int(m["FractionWhole"])+int(m["FractionNumerator"])/int(m["FractionDenominator"]), ""
+        # nnn/nnn (which is understood as vol/num)
+        if form == "VolSlashNum":
+            return int(m["VolSlashNumVol"]), int(m["VolSlashNumNum"]), "", None, ""
+        # xxx/nnn, where xxx is in Roman numerals
+        if form == "RomanSlashNum":
             #TODO: the regex detects more than just Roman numerals.  We need to bail out of this branch if that happens and not return
-            return cls(Vol=InterpretRoman(m.groups()[0]), Num=int(m.groups()[1]))
-
-        # Next look for nnn-nnn (which is a range of issue numbers; only the start is returned)
-        # Leading stuff + nnn + dash + nnn
-        m=re.match(r"^(\d+)-(\d+)$", s)
-        if m is not None and len(m.groups()) == 2:
-            return cls(Whole=int(m.groups()[0]))
-
-        # Next look for #nnn
-        # Leading stuff + nnn
-        m=re.match(r"^#(\d+)$", s)
-        if m is not None and len(m.groups()) == 1:
-            return cls(Whole=int(m.groups()[0]))
-
-        # Now look for a trailing decimal number
-        # Leading characters + single non-digit + nnn + dot + nnn + whitespace
-        # the ? makes * a non-greedy quantifier
-        m=re.match(r"^.*?(\d+\.\d+)$", s)
-        if m is not None and len(m.groups()) == 1:
-            return cls(Num=float(m.groups()[0]))
-
-        if not strict and not complete:
-            # Now look for a single trailing number
-            # Leading stuff + nnn + optional single alphabetic character suffix + whitespace
-            m=re.match(r"^.*?([0-9]+)([a-zA-Z]?)\s*$", s)
-            if m is not None and len(m.groups()) in [1, 2]:
-                ws=None
-                if len(m.groups()) == 2:
-                    ws=m.groups()[1].strip()
-                return cls(Whole=int(m.groups()[0]), WSuffix=ws)
-
-            # Now look for trailing Roman numerals
-            # Leading stuff + mandatory whitespace + roman numeral characters + optional trailing whitespace
-            m=re.match(r"^.*?\s+([IVXLC]+)\s*$", s)
-            if m is not None and len(m.groups()) == 1:
-                return cls(Num=InterpretRoman(m.groups()[0]))
-
-        # No good, return failure
-        return cls()
+            return InterpretRoman(m["RomanSlashNumVol"]), int(m["RomanSlashNumNum"]), "", None, ""
+        # nnn-nnn (which is a range of issue numbers; only the start is returned)
+        if form == "WholeRange":
+            return None, None, "", int(m["WholeRangeStart"]), ""
+        # #nnn
+        if form == "HashWhole":
+            return None, None, "", int(m["HashWholeWhole"]), ""
+        # A trailing decimal number
+        return None, float(m["TrailingDecimalNum"]), "", None, ""
+
+    # The looser formats need a trailing number, number+letter or Roman numeral; check the end of (the stripped) s before running their backtracking regex
+    last=s[-1:]
+    if loose and last != "" and (last in _TRAILING_SERIAL_END_CHARS or (last.isalpha() and s[-2:-1].isdigit())):
+        m=_RE_TRAILING_SERIAL.match(s)
+        if m is not None:
+            # A single trailing number, with an optional single alphabetic character suffix
+            if m.lastgroup == "TrailingWhole":
+                return None, None, "", int(m["TrailingWholeWhole"]), m["TrailingWholeSuffix"]
+            # Trailing Roman numerals
+            return None, InterpretRoman(m["TrailingRomanNum"]), "", None, ""
+
+    # No good, return failure
+    return None, None, "", None, ""
 
 
 #$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 class FanzineIssueSpec:
+    __slots__=("_FS", "_FD")
 
     def __init__(self, Vol: None|int|str=None,
                  Num: None|int|str=None,
@@ -823,27 +800,22 @@ class FanzineIssueSpec:
     def __lt__(self, other: FanzineIssueSpec) -> bool:         
         if other is None:
             return False
-        if self._FD is not None and other._FD is not None:
-            return self._FD < other._FD
-        if self._FS is not None and other._FS is not None:
-            return self._FS < other._FS
-        return False
+        return self.SortKey() < other.SortKey()
+
+    #-----------------------------
+    # The tuple that __lt__ compares: the date's sort key, then the serial's.  (A missing FD or FS sorts first.)
+    # Use it directly as a sort key (e.g., sorted(fislist, key=FanzineIssueSpec.SortKey))
+    def SortKey(self) -> tuple:
+        return (() if self._FD is None else self._FD.SortKey(), () if self._FS is None else self._FS.SortKey())
 
     def Copy(self, other: FanzineIssueSpec) -> None:        
         self._FD=other._FD
         self._FS=other._FS
 
     def DeepCopy(self, other: FanzineIssueSpec) -> None:
-        self.Vol=other.Vol
-        self.Num=other.Num
-        self.NumSuffix=other.NumSuffix
-        self.Whole=other.Whole
-        self.WSuffix=other.WSuffix
-        self.Year=other.Year
-        self.Month=other.Month
-        self.Day=other.Day
-        self.FS.Copy(other.FS)
-        self.FD.Copy(other.FD)
+        # The Copy()s copy every field, so there's no need to go through the individual properties first
+        self._FS.Copy(other._FS)
+        self._FD.Copy(other._FD)
 
 
     # .....................
@@ -907,7 +879,8 @@ class FanzineIssueSpec:
 
     @Whole.setter
     def Whole(self, val: int|str|None)-> None:      
-        print("Setting _FS.Whole to "+str(val))
+        if _Debug:
+            print("Setting _FS.Whole to "+str(val))
         if val is not None and isinstance(val, str) and len(val) == 0:
             self._FS.Whole=None
         else:
@@ -933,7 +906,7 @@ class FanzineIssueSpec:
 
     @Year.setter
     def Year(self, val: int|str|None)-> None:   
-        self._FS.Year=val
+        self._FD.Year=val
 
     #.....................
     # This is a non-settable property -- it is always derived from the numeric Year
@@ -1008,25 +981,27 @@ class FanzineIssueSpec:
 
         # A number standing by itself is messy, since it's easy to confuse with a date
         # In the FanzineIssueSpec world, we will always treat it as a Serial, so look for that first
-        m=re.match(r"^(\d+)$", s)
-        if m is not None and len(m.groups()) == 1:
-            w=m.groups()[0]
+        m=_RE_DIGITS.match(s)
+        if m is not None:
+            w=m.group(1)
             fs=FanzineSerial(Whole=w)
             return cls(FS=fs)
 
         # First try a date, and interpret it strictly no matter what the parameter says -- we can try non-strict later
-        fd=FanzineDate().Match(s, strict=True, complete=True)
-        if not fd.IsEmpty():
-            return cls(FD=fd)
+        # (Something which starts like a serial -- "#" or "V" or "Vol" and a number -- can never be a date, so don't bother trying.)
+        if _RE_SERIAL_PREFIX.match(s) is None:
+            fd=FanzineDate.Match(s, strict=True, complete=True)
+            if not fd.IsEmpty():
+                return cls(FD=fd)
 
         # OK, it's probably not a date.  So try it as a serial ID
-        fs=FanzineSerial().Match(s, strict=strict, complete=True)
+        fs=FanzineSerial.Match(s, strict=strict, complete=True)
         if not fs.IsEmpty():
             return cls(FS=fs)
 
         # That didn't work, either.  Try a non-strict date followed by a non-strict serial
         # OK, it's probably not a date.  So try it as a serial ID
-        fs=FanzineSerial().Match(s, complete=complete)
+        fs=FanzineSerial.Match(s, complete=complete)
         if not fs.IsEmpty():
             return cls(FS=fs)
 
@@ -1049,6 +1024,11 @@ class FanzineIssueSpec:
     def FormatSerialForSorting(self) -> str:         
         return self._FS.FormatSerialForSorting()
 
+    #=============================================================================
+    # A tuple which sorts the Vol/Num/Whole information; much cheaper than comparing FormatSerialForSorting() strings
+    def SerialSortKey(self) -> tuple:
+        return self._FS.SortKey()
+
 ######################################################################################################################
 ######################################################################################################################
 # Now define class FanzineIssueSpecList
@@ -1060,6 +1040,8 @@ class FanzineIssueSpec:
 #TODO: a series does not have a consistent set throughout.
 
 class FanzineIssueSpecList:
+    __slots__=("_List",)
+
     def __init__(self, List: list[FanzineIssueSpec]|None=None) -> None:
         self._List=None
         self.List=List  # Use setter
@@ -1082,32 +1064,25 @@ class FanzineIssueSpecList:
         if self._List is None:
             self._List=[]
 
-        if isinstance(val, FanzineIssueSpecList):
-            lst=val.List
-            if lst is None or len(lst) == 0:
-                pass      # Nothing to do
-            else:
-                self._List.extend(lst)
-        elif isinstance(val, list):
-            if len(val) == 0:
-                pass        # Nothing to do
-            else:
-                self._List.extend(val)
-        elif isinstance(val, FanzineIssueSpec):
+        # Check for a single FIS first, since appending one at a time is the commonest case
+        # (Extending by an empty list is harmless, so there's no need to check for that)
+        if isinstance(val, FanzineIssueSpec):
             self._List.append(val)
+        elif isinstance(val, FanzineIssueSpecList):
+            if val._List is not None:
+                self._List.extend(val._List)
+        elif isinstance(val, list):
+            self._List.extend(val)
         else:
             Exception("FanzineIssueSpecList.Extend: Uninterpretable val type")
         return self
 
     # ...............................
     def IsEmpty(self) -> bool:      
-        if self._List is None or len(self._List) == 0:
+        if not self._List:
             return True
-        # Next we go through the elements of the list. If *any* element is non-empty, then the whole FISL is non-empty
-        for fis in self._List:
-            if not fis.IsEmpty():
-                return False
-        return True
+        # If *any* element is non-empty, then the whole FISL is non-empty
+        return all(fis.IsEmpty() for fis in self._List)
 
     # ...............................
     def __repr__(self) -> str:      
@@ -1186,20 +1161,26 @@ class FanzineIssueSpecList:
         if len(tokens) == 0:
             return None, s
 
-        leadingText=" ".join(tokens)
+        # The trailing text is built up one token at a time, rather than re-joined from scratch on each pass
         longestFISL=None
+        trailingText=""
+        start=len(tokens)      # The index of the first token of longestFISL's text
         for index in range(len(tokens)-1, -1, -1):  # Ugly, but I need index to be the indexes of the tokens
-            trailingText=" ".join(tokens[index:])
-            leadingText=" ".join(tokens[:index])
-            print("     index="+str(index)+"   leading='"+leadingText+"'    trailing='"+trailingText+"'")
-            trialFISL=FanzineIssueSpecList().Match(trailingText, strict=True, complete=True)  # Failed.  We've gone one too far. Quit trying and use what we found on the previous iteration
-            if trialFISL.IsEmpty():
-                print("     ...backtracking. Found FISL="+repr(trialFISL))
-                leadingText=" ".join(tokens[0:index+1])
+            trialText=tokens[index] if trailingText == "" else tokens[index]+" "+trailingText
+            if _Debug:
+                print("     index="+str(index)+"   leading='"+" ".join(tokens[:index])+"'    trailing='"+trialText+"'")
+            trialFISL=FanzineIssueSpecList.Match(trialText, strict=True, complete=True)
+            if trialFISL.IsEmpty():     # Failed.  We've gone one too far. Quit trying and use what we found on the previous iteration
+                if _Debug:
+                    print("     ...backtracking. Found FISL="+repr(trialFISL))
                 break
             longestFISL=trialFISL
+            trailingText=trialText
+            start=index
         # At this point, leadingText is the fanzine's series name and longestFISL is a list of FanzineSerials found for it
-        print("     Found: "+str(longestFISL))
+        leadingText=" ".join(tokens[:start])
+        if _Debug:
+            print("     Found: "+str(longestFISL))
         return longestFISL, leadingText
 
     #------------------------------------------------------------------------------------
@@ -1214,54 +1195,62 @@ class FanzineIssueSpecList:
         tokens=[t.strip() for t in s.split(",")]        # Split the input on commas
 
         # The strategy will be to worth through the list of issue information, taking one at a time.
-        while len(tokens) > 0:
+        # (We walk an index along the list rather than deleting tokens from its front, which would copy the rest of the list each time.)
+        i=0
+        while i < len(tokens):
+            token=tokens[i]
             # Because some legitimate FISs have an internal comma, they may have been split into two tokens, so we first joing the leading two tokens and see if they make sense
             # If there are at least two tokens left, re-join them and see if the result is an FIS of the form <Month> [day], yyyy
             # We can't allow 2-digit years here because they are indistinguishable from issue numbers.
-            if len(tokens) > 1:
+            if i+1 < len(tokens):
                 #TODO: We are currently being very conservative in what we recognize here.  This might well be improved.
+                # Token 1 must be a 4-digit year (the cheapest test, so it goes first)
                 # Token 0 must contain a month name as its first token and may not start with a digit
-                if not tokens[0][0].isdigit() and MonthNameToInt(tokens[0].split()[0]) is not None:
-                    # Token 1 must be a 4-digit year
-                    if re.match(r"^\d{4}$", tokens[1]) is not None:
-                        # The put them together and try to interpret as a date
-                        trial=tokens[0]+", "+tokens[1]
-                        fis=FanzineIssueSpec().Match(trial, strict=True, complete=True)    # This match must consume the entire input -- no partial matches
-                        if not fis.IsEmpty():
-                            fislist.append(fis)
-                            del tokens[0:1]     # Delete both leading tokens.
-                            continue
+                if _RE_YEAR.match(tokens[i+1]) is not None and token != "" and not token[0].isdigit() and MonthNameToInt(token.split(None, 1)[0]) is not None:
+                    # The put them together and try to interpret as a date
+                    trial=token+", "+tokens[i+1]
+                    fis=FanzineIssueSpec.Match(trial, strict=True, complete=True)    # This match must consume the entire input -- no partial matches
+                    if not fis.IsEmpty():
+                        fislist.append(fis)
+                        i+=2     # Move past both of the tokens we just used
+                        continue
 
             # Interpreting the first two tokensas one  didn't work, so now try just the first token
             # The first thing to look for is a range denoting multiple issues.  This will necessarily contain a hyphen, which can only appear to denote a range
             # nnn-nnn
             #TODO: Consider also handling date ranges, e.g., Jan-Jun 2001
-            if "-" in tokens[0]:
-                subtokens=tokens[0].split("-")
+            if "-" in token:
+                subtokens=token.split("-")
                 # For now, at least, we can only handle the case of two subtokens, both of which are integers with the first the smaller
                 if len(subtokens) != 2:
                     Log("FanzineIssueSpecList:Match: More than one hyphen found in '"+s+"'")
                     return cls()
-                if not IsInt(subtokens[0]) or not IsInt(subtokens[1]) or int(subtokens[0]) >= int(subtokens[1]):
+                first=subtokens[0].strip()
+                last=subtokens[1].strip()
+                if not first.isdecimal() or not last.isdecimal():
+                    Log("FanzineIssueSpecList:Match: bad range values in '"+s+"'")
+                    return cls()
+                first=int(first)
+                last=int(last)
+                if first >= last:
                     Log("FanzineIssueSpecList:Match: bad range values in '"+s+"'")
                     return cls()
-                for i in range(int(subtokens[0]), int(subtokens[1])+1):
-                    fislist.append(FanzineIssueSpec(Whole=i))
-                del tokens[0]
+                fislist.extend([FanzineIssueSpec(Whole=j) for j in range(first, last+1)])
+                i+=1
                 continue
 
             # It's neither a group including a comma nor a range.  Try to interpret the token as a single FIS
             # Now just look for a single issue
             # nnn or Vnn #nn or variants or dates, etc.
-            fis=FanzineIssueSpec().Match(tokens[0], strict=strict, complete=complete)
+            fis=FanzineIssueSpec.Match(token, strict=strict, complete=complete)
             if not fis.IsEmpty():
                 fislist.append(fis)
-                del tokens[0]
+                i+=1
                 continue
 
             # Nothing worked, so we won't have an FISL
-            Log("FanzineIssueSpecList.Match can't interpret '"+str(tokens[0]+"' as an issue spec.  It is ignored."))
-            del tokens[0]
+            Log("FanzineIssueSpecList.Match can't interpret '"+str(token+"' as an issue spec.  It is ignored."))
+            i+=1
 
         # We have consumed the whole input.  Return a FISL
         return cls(List=fislist)
@@ -1280,27 +1269,30 @@ class FanzineIssueSpecList:
 #####################################################################################################################
 
 class FanzineIssueInfo:
+    __slots__=("_Series", "_IssueName", "_DisplayName", "_DirURL", "_PageFilename", "_FIS", "_Position", "_Pagecount", "_Editor", "_Locale",
+               "_Taglist", "_Mailings", "_Temp", "_AlphabetizeIndividually", "_FanzineType")
+
+    # The instance variables.  (Declared here, without values, for documentation only: __init__ sets them all, mostly through the properties.)
+    _Series: FanzineSeriesInfo|None
+    _IssueName: str         # Name of this issue (does not include issue #/date info)
+    _DisplayName: str       # Name to use for this issue. Includes issue serial and or date
+    _DirURL: str            # URL of fanzine directory
+    _PageFilename: str      # URL of specific issue in directory
+    _FIS: FanzineIssueSpec|None     # FIS for this issue
+    _Position: int          # The index in the source fanzine index table
+    _Pagecount: int         # Page count for this issue.  Never less than 1: the setter turns a missing or non-positive count into 1
+    _Editor: str            # The editor for this issue.  If None, use the editor of the series
+    _Locale: Locale
+    _Taglist: list[str]|None    # A list of tags for this fanzine (e.g., "newszine")
+    _Mailings: list[str]    # A List of APA mailings this issue was a part of
+    _Temp: any              # Used outside the class to hold random information
+    _AlphabetizeIndividually: bool
+    _FanzineType: str
 
     def __init__(self, Series: FanzineSeriesInfo|None=None, IssueName: str="", DisplayName: str="",
                  DirURL: str="", PageFilename: str="", FIS: FanzineIssueSpec|None=None, Position: int=-1,
                  Pagecount: int|None=None, Editor: str="", Country: str="", Taglist: list[str]=None, Mailings: list[str]=None, Temp: any=None, AlphabetizeIndividually: bool=False,
                  FanzineType: str="") -> None:
-        _Series: FanzineSeriesInfo|None=None
-        _IssueName: str=""      # Name of this issue (does not include issue #/date info)
-        _DisplayName: str=""    # Name to use for this issue. Includes issue serial and or date
-        _DirURL: str=""  # URL of fanzine directory
-        _PageFilename: str=""  # URL of specific issue in directory
-        _FIS: FanzineIssueSpec|None=None  # FIS for this issue
-        _Position: int=-1        # The index in the source fanzine index table
-        _Pagecount: int=0  # Page count for this issue
-        _Editor: str=""     # The editor for this issue.  If None, use the editor of the series
-        _Locale: Locale
-        _Taglist: list[str]|None=None  # A list of tags for this fanzine (e.g., "newszine")
-        _Mailings: list[str]=[]  # A List of APA mailings this issue was a part of
-        _Temp: any=None     # Used outside the class to hold random information
-        _AlphabetizeIndividually: bool=False
-        _FanzineType: str=""
-
         # Use the properties to set the values for all of the instance variables. We do this so that any special setter processing is done with the init values.
         self.Series=Series
         self.IssueName=IssueName
@@ -1321,34 +1313,40 @@ class FanzineIssueInfo:
     # .....................
     def __str__(self) -> str:                       
         out=""
-        if self.DisplayName != "":
-            return self.DisplayName
+        displayName=self.DisplayName
+        if displayName != "":
+            return displayName
 
-        if self.IssueName != "":
-            out=self.IssueName
+        if self._IssueName != "":
+            out=self._IssueName
         elif self.SeriesName != "":
             out=self.SeriesName
 
-        if self.FIS is not None and len(str(self.FIS)) > 0:
-            out+=" "+str(self.FIS)
+        if self._FIS is not None:
+            fis=str(self._FIS)
+            if len(fis) > 0:
+                out+=" "+fis
 
         return out.strip()
 
     # .....................
     def __repr__(self) -> str:                       
         out=""
-        if self.DisplayName != "":
-            out="'"+self.DisplayName+"'"
-        elif self.IssueName != "":
-            out=self.IssueName
+        displayName=self.DisplayName
+        if displayName != "":
+            out="'"+displayName+"'"
+        elif self._IssueName != "":
+            out=self._IssueName
         elif self.SeriesName != "":
             out=self.SeriesName
 
-        if self.FIS is not None and len(str(self.FIS)) > 0:
-            out+=" {"+str(self.FIS)+"}"
+        if self._FIS is not None:
+            fis=str(self._FIS)
+            if len(fis) > 0:
+                out+=" {"+fis+"}"
 
-        if self.Editor != "":
-            out+="  ed:"+self.Editor
+        if self._Editor != "":
+            out+="  ed:"+self._Editor
         if self.Pagecount is not None:
             out+="  "+str(self.Pagecount)+" pp"
 
@@ -1356,44 +1354,41 @@ class FanzineIssueInfo:
 
     # .....................
     def __eq__(self, other:FanzineIssueInfo) -> bool:                       
-        if self.SeriesName != other.SeriesName:
-            return False
-        if self._Editor != other._Editor:
-            return False
-        if self._IssueName != other._IssueName:
-            return False
-        if self._DisplayName != other._DisplayName:
-            return False
-        if self._DirURL != other._DirURL:
-            return False
-        if self._PageFilename != other._PageFilename:
+        # The plain fields are compared as one tuple, with the cheapest and most distinguishing first
+        if (self._Pagecount, self._PageFilename, self._DirURL, self._IssueName, self._DisplayName, self._Editor, self._FanzineType) != \
+                (other._Pagecount, other._PageFilename, other._DirURL, other._IssueName, other._DisplayName, other._Editor, other._FanzineType):
             return False
-        if self._Pagecount != other._Pagecount:
-            return False
-        if self._FanzineType != other._FanzineType:
+        # SeriesName goes through a property, so it's only looked up once the plain fields have matched
+        if self.SeriesName != other.SeriesName:
             return False
-        if self._FIS is not None and not self._FIS.IsEmpty():
-            if other._FIS is None or other._FIS.IsEmpty():
+        sfis=self._FIS
+        if sfis is not None and not sfis.IsEmpty():
+            ofis=other._FIS
+            if ofis is None or ofis.IsEmpty():
                 return False
-            if self._FIS != other._FIS:
+            if sfis != ofis:
                 return False
         return True
 
 
     def DeepCopy(self) -> FanzineIssueInfo:
-        fz=FanzineIssueInfo(Series=self.Series, IssueName=self.IssueName, DisplayName=self.DisplayName, DirURL=self.DirURL,
-                            PageFilename=self.PageFilename, FIS=self.FIS, Pagecount=self.Pagecount, Editor=self.Editor, Country="",
-                            Taglist=None, Mailings=self.Mailings, Temp=self.Temp, FanzineType=self.FanzineType)
+        fz=FanzineIssueInfo(Series=self.Series, IssueName=self._IssueName, DisplayName=self.DisplayName, DirURL=self._DirURL,
+                            PageFilename=self._PageFilename, FIS=self._FIS, Pagecount=self.Pagecount, Editor=self._Editor, Country="",
+                            Taglist=self._Taglist.copy(), Mailings=self._Mailings.copy(), Temp=self._Temp, FanzineType=self._FanzineType)
         # Do some touch-ups
         fz._Locale=self.Locale
-        fz.Taglist=[x for x in self.Taglist]
         return fz
 
     # .....................
     def IsEmpty(self) -> bool:                       
-        if self.SeriesName != "" or self.IssueName != "" or self._DisplayName != "" or self.DirURL != "" or self.PageFilename != "" or self.Pagecount > 0 or self.Editor != "" or self.Taglist or self.Mailings:
+        # The plain string fields are the cheapest tests and the likeliest to be filled in, so they go first.
+        # The recursive FIS test is only reached if all else is empty.
+        # (The page count can't tell us anything, since the setter never lets it drop below 1.)
+        series=self._Series
+        if self._IssueName != "" or self._DirURL != "" or self._PageFilename != "" or self._DisplayName != "" or self._Editor != "" \
+                or (series is not None and series.SeriesName != "") or self._Taglist or self._Mailings:
             return False
-        return self.FIS.IsEmpty()
+        return self._FIS is None or self._FIS.IsEmpty()
 
     # .....................
     @property
@@ -1428,9 +1423,10 @@ class FanzineIssueInfo:
     def DisplayName(self) -> str:                       
         if self._DisplayName != "":
             return self._DisplayName
-        if self.FIS is not None and self.SeriesName != "":
-            return self.SeriesName+" "+str(self.FIS)
-        return self.SeriesName
+        seriesName=self.SeriesName
+        if self._FIS is not None and seriesName != "":
+            return seriesName+" "+str(self._FIS)
+        return seriesName
     @DisplayName.setter
     def DisplayName(self, val: str) -> None:                       
         self._DisplayName=val.strip()
@@ -1491,10 +1487,10 @@ class FanzineIssueInfo:
     # .....................
     @property
     def Pagecount(self) -> int:                       
-        return self._Pagecount if self._Pagecount > 0 else 1
+        return self._Pagecount
     @Pagecount.setter
-    def Pagecount(self, val: int) -> None:                      
-        self._Pagecount=val
+    def Pagecount(self, val: int|None) -> None:                      
+        self._Pagecount=val if val is not None and val > 0 else 1     # A missing or non-positive page count is taken to be 1
 
     # .....................
     @property
@@ -1649,7 +1645,7 @@ class FanzineSeriesList:
         if self._SeriesURL != "":
             u=self._SeriesURL
 
-        return "FSS(SN:"+sn+", IIL:"+iil+", Ed:"+ed+", NT:"+nt+", El:"+el+" URL="+u+")"
+        return f"FSS(SN:{sn}, IIL:{iil}, Ed:{ed}, NT:{nt}, El:{el} URL={u})"
 
     # .....................
     def __str__(self) -> str:  # Pretty print the FSS            
@@ -1664,10 +1660,7 @@ class FanzineSeriesList:
             out+=f"   ({self._Notes}) "
 
         if self._FIIL is not None and len(self._FIIL) > 0:
-            out+="  FIIL: "
-            for i in self._FIIL:
-                if not i.IsEmpty():
-                    out+=str(i)+", "
+            out+="  FIIL: "+"".join(str(i)+", " for i in self._FIIL if not i.IsEmpty())
         return out
 
 
@@ -1679,40 +1672,54 @@ class FanzineSeriesList:
 
 
 
+#==============================================================================
+# Convert a table cell to a number
+# Cells usually hold nothing but ASCII digits, which we convert directly; anything else goes to the general-purpose interpreter passed in
+def _InterpretCell(text: str, interpreter: Callable[[str], int|float|None]) -> int|float|None:
+    if text.isascii() and text.isdecimal():
+        return int(text)
+    return interpreter(text)
+
+
 #==============================================================================
 # Given the contents of various table columns, attempt to extract serial information
 # This uses InterpretSerial for detailed decoding
-def ExtractSerialNumber(volText: str, numText: str, wholeText: str, volNumText: str, titleText: str) -> FanzineSerial:
-    wholeInt=None
-    volInt=None
-    numInt=None
-    numsuffix=None
-    maybeWholeInt=None
-    wsuffix=None
+def ExtractSerialNumber(volText: str|None, numText: str|None, wholeText: str|None, volNumText: str|None, titleText: str|list[str]|None) -> FanzineSerial:
+    # Sparse indexes often have none of these columns filled in
+    # (FanzineSerials are mutable, so this returns a new empty one rather than sharing a single instance.)
+    if volText is None and numText is None and wholeText is None and volNumText is None and titleText is None:
+        return FanzineSerial()
+
+    wholeInt: int|float|None=None
+    volInt: int|float|None=None
+    numInt: int|float|None=None
+    numsuffix: str|None=None
+    maybeWholeInt: int|None=None
+    wsuffix: str|None=None
 
     if wholeText is not None:
-        wholeInt=InterpretNumber(wholeText)
+        wholeInt=_InterpretCell(wholeText, InterpretNumber)
 
+    # Only the parsed values are wanted here, so we call FanzineSerial.Match's (cached) parser directly rather than building FanzineSerials
     if volNumText is not None:
-        ser=FanzineSerial().Match(volNumText)
-        if ser.Vol is not None and ser.Num is not None:  # Otherwise, we don't actually have a volume+number
-            volInt=ser.Vol
-            numInt=ser.Num
-            numsuffix=ser.NumSuffix
+        serVol, serNum, serNumSuffix, _, _=_MatchSerial(volNumText.strip(), True)
+        if serVol is not None and serNum is not None:  # Otherwise, we don't actually have a volume+number
+            volInt=serVol
+            numInt=serNum
+            numsuffix=serNumSuffix
 
     if volText is not None:
-        volInt=InterpretInteger(volText)
-
-    # If there's no vol, anything under "Num", etc., must actually be a whole number
-    if volText is None:
-        with suppress(Exception):
-            maybeWholeText=numText
-            maybeWholeInt=int(maybeWholeText)
-            numText=None
-
-    # But if there *is* a volume specified, than any number not labelled "whole" must be a number within the volume
-    if volText is not None and numText is not None:
-        numInt=InterpretInteger(numText)
+        volInt=_InterpretCell(volText, InterpretInteger)
+        # If there *is* a volume specified, than any number not labelled "whole" must be a number within the volume
+        if numText is not None:
+            numInt=_InterpretCell(numText, InterpretInteger)
+    elif numText is not None:
+        # But if there's no vol, anything under "Num", etc., must actually be a whole number -- if it's an integer at all
+        digits=numText.strip()
+        if digits[:1] in ("+", "-"):
+            digits=digits[1:]
+        if digits.isdecimal():
+            maybeWholeInt=int(numText)
 
     # OK, now figure out the vol, num and whole.
     # First, if a Vol is present, and an unambigious Num is absent, the an ambigious Num must be the Vol's num
@@ -1725,6 +1732,9 @@ def ExtractSerialNumber(volText: str, numText: str, wholeText: str, volNumText:
         wholeInt=maybeWholeInt
 
     # Next, look at the title -- titles often have a serial designation at their end.
+    # We may have been given a list of titles rather than a single one; if so, use the first.
+    if titleText is not None and not isinstance(titleText, str):
+        titleText=titleText[0] if titleText else None
 
     if titleText is not None:
         # Possible formats:
@@ -1733,36 +1743,36 @@ def ExtractSerialNumber(volText: str, numText: str, wholeText: str, volNumText:
         #   Vn  -- a volume number, but where's the issue?
         #   Vn[,] #m  -- a volume and number-within-volume
         #   Vn.m -- ditto
-        ser=FanzineSerial().Match(titleText if not isinstance(titleText, list) else titleText[0])
+        serVol, serNum, serNumSuffix, serWhole, serWSuffix=_MatchSerial(titleText.strip(), True)
 
         # Some indexes have fanzine names ending in <month> <year>.  We'll detect these by looking for a trailing number between 1930 and 2050, and reject
         # getting vol/ser, etc., from the title if we find it.
-        if ser.Num is None or ser.Num < 1930 or ser.Num > 2050:
+        if serNum is None or serNum < 1930 or serNum > 2050:
 
-            if ser.Vol is not None and ser.Num is not None:
+            if serVol is not None and serNum is not None:
                 if volInt is None:
-                    volInt=ser.Vol
+                    volInt=serVol
                 if numInt is None:
-                    numInt=ser.Num
+                    numInt=serNum
 
-                if volInt != ser.Vol:
-                    LogError("***Inconsistent serial designations: Volume='"+str(volInt)+"' which is not Vol='"+str(ser.Vol)+"'")
-                if numInt != ser.Num:
-                    LogError("***Inconsistent serial designations: Number='"+str(numInt)+"' which is not Num='"+str(ser.Num)+"'")
+                if volInt != serVol:
+                    LogError(f"***Inconsistent serial designations: Volume='{volInt}' which is not Vol='{serVol}'")
+                if numInt != serNum:
+                    LogError(f"***Inconsistent serial designations: Number='{numInt}' which is not Num='{serNum}'")
 
-            elif ser.Num is not None:
+            elif serNum is not None:
                 if wholeInt is None:
-                    wholeInt=ser.Num
+                    wholeInt=serNum
 
-                if wholeInt != ser.Num:
-                    LogError("***Inconsistent serial designations: Whole='"+str(wholeInt)+"'  which is not Num='"+str(ser.Num)+"'")
+                if wholeInt != serNum:
+                    LogError(f"***Inconsistent serial designations: Whole='{wholeInt}'  which is not Num='{serNum}'")
 
-            if ser.Whole is not None:
-                wholeInt=ser.Whole
+            if serWhole is not None:
+                wholeInt=serWhole
 
-            numsuffix=ser.NumSuffix
-            wsuffix=ser.WSuffix
+            numsuffix=serNumSuffix
+            wsuffix=serWSuffix
 
-    return FanzineSerial(Vol=volInt, Num=numInt, NumSuffix=numsuffix, Whole=wholeInt, WSuffix=wsuffix)
+    return FanzineSerial(volInt, numInt, numsuffix, wholeInt, wsuffix)
 
 